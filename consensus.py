@@ -0,0 +1,41 @@
+from collections import Counter
+from statistics import median
+
+# Modes de jeu (mêmes codes que Vote.PARTIE_CHOICES)
+MODES = ['strict', 'moyenne', 'mediane', 'majorite_absolue', 'majorite_relative']
+
+
+def decision_tour(mode, valeurs, premier_tour):
+    """
+    Règle de consensus d'un tour de vote, appliquée par demarrer_vote.
+
+    Un tour unanime conclut toujours. Sinon le premier tour d'une
+    fonctionnalité et tous les tours du mode strict échouent ; aux tours
+    suivants, les autres modes tranchent par moyenne, médiane ou majorité.
+    `valeurs` contient la valeur de chaque carte jouée (None pour une carte
+    sans valeur, comme "cafe"). Retourne (conclu, estimation), l'estimation
+    valant None si le tour n'est pas conclu.
+    simulation.regle_consensus en est la version vectorisée.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Mode de jeu inconnu : {mode}")
+
+    if valeurs and valeurs[0] is not None and all(valeur == valeurs[0] for valeur in valeurs):
+        return True, valeurs[0]
+    numeriques = [valeur for valeur in valeurs if valeur is not None]
+    if mode == 'strict' or premier_tour or not numeriques:
+        return False, None
+
+    if mode == 'moyenne':
+        return True, sum(numeriques) / len(numeriques)
+    if mode == 'mediane':
+        return True, median(numeriques)
+
+    comptes = Counter(numeriques).most_common()
+    gagnante, maximum = comptes[0]
+    if mode == 'majorite_absolue':
+        return (True, gagnante) if maximum * 2 > len(valeurs) else (False, None)
+    # Majorité relative : une égalité entre cartes en tête impose un nouveau tour
+    if len(comptes) > 1 and comptes[1][1] == maximum:
+        return False, None
+    return True, gagnante
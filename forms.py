@@ -23,10 +23,11 @@ class PartieForm(forms.ModelForm):
 
     class Meta:
         model = Partie
-        fields = ['nom', 'mode_jeu', 'administrateur', 'participants', 'fonctionnalites_json']
+        fields = ['nom', 'mode_jeu', 'paquet', 'administrateur', 'participants', 'fonctionnalites_json']
         widgets = {
             'nom': forms.TextInput(attrs={'class': 'form-control'}),
             'mode_jeu': forms.Select(attrs={'class': 'form-control'}),
+            'paquet': forms.Select(attrs={'class': 'form-control'}),
         }
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
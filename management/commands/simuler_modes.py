@@ -0,0 +1,57 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...paquets import PAQUETS
+from ...simulation import MODES, simuler
+
+
+class Command(BaseCommand):
+    help = "Compare les modes de jeu par simulation de Monte Carlo (tours, erreur et temps par fonctionnalité)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--modes', nargs='+', choices=MODES, default=MODES, help="Modes de jeu à comparer")
+        parser.add_argument('--simulations', type=int, default=100_000, help="Fonctionnalités simulées par mode")
+        parser.add_argument('--paquet', choices=list(PAQUETS), default='fibonacci', help="Paquet de cartes utilisé")
+        parser.add_argument('--joueurs', type=int, default=5, help="Nombre de joueurs")
+        parser.add_argument('--max-tours', type=int, default=20, help="Tours maximum avant abandon d'une fonctionnalité")
+        parser.add_argument('--duree-tour', type=float, default=120.0, help="Durée d'un tour de vote en secondes")
+        parser.add_argument('--processus', type=int, default=None, help="Nombre de processus (par défaut : tous les cœurs)")
+        parser.add_argument('--graine', type=int, default=None, help="Graine aléatoire pour des résultats reproductibles")
+        parser.add_argument('--json', action='store_true', help="Affiche le rapport au format JSON")
+
+    def handle(self, *args, **options):
+        if options['simulations'] < 1 or options['joueurs'] < 1 or options['max_tours'] < 1:
+            raise CommandError("Les simulations, joueurs et tours maximum doivent être positifs.")
+        if options['processus'] is not None and options['processus'] < 1:
+            raise CommandError("Le nombre de processus doit être positif.")
+
+        rapport = simuler(
+            modes=options['modes'],
+            simulations=options['simulations'],
+            joueurs=options['joueurs'],
+            cartes=[carte.valeur for carte in PAQUETS[options['paquet']] if carte.valeur is not None],
+            max_tours=options['max_tours'],
+            duree_tour=options['duree_tour'],
+            processus=options['processus'],
+            graine=options['graine'],
+        )
+
+        if options['json']:
+            self.stdout.write(json.dumps(rapport, indent=4))
+            return
+
+        self.stdout.write(
+            f"{'Mode':<20}{'Tours':>8}{'Écart-type':>12}{'Temps (s)':>11}{'Non conv.':>11}"
+            f"{'Erreur':>10}{'Tours (consensus)':>19}"
+        )
+        for mode, resultat in rapport.items():
+            # Valeurs absentes si aucune fonctionnalité n'a abouti à un consensus
+            def formater(cle, format_):
+                return format(resultat[cle], format_) if resultat[cle] is not None else '-'
+
+            self.stdout.write(
+                f"{mode:<20}{resultat['tours_moyens']:>8.2f}{resultat['ecart_type_tours']:>12.2f}"
+                f"{resultat['temps_par_fonctionnalite']:>11.0f}{resultat['taux_non_convergence']:>11.1%}"
+                f"{formater('erreur_moyenne', '.1%'):>10}{formater('tours_moyens_consensus', '.2f'):>19}"
+            )
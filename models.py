@@ -1,7 +1,11 @@
 import json
 import os
 from django.db import models
+from django.db.models import F
 from django.conf import settings
+from django.utils import timezone
+
+from . import paquets
 
 # Modèle pour représenter un joueur
 class Participant(models.Model):
@@ -21,6 +25,12 @@ class Fonctionnalite(models.Model):
     valide = models.BooleanField(default=False)  # Indique si la fonctionnalité a été validée par tous
     difficulte = models.FloatField(null=True, blank=True)  # Moyenne des votes
 
+    def valider(self):
+        """Valide la fonctionnalité et invalide les caches de toutes les parties qui la partagent."""
+        self.valide = True
+        self.save(update_fields=['valide'])
+        self.parties.update(version=F('version') + 1, date_modification=timezone.now())
+
     def __str__(self):
         return self.name
 
@@ -38,6 +48,31 @@ class Partie(models.Model):
         default='strict'
     )
     fonctionnalites = models.ManyToManyField(Fonctionnalite, related_name='parties', blank=True)  # Ajout des fonctionnalités
+    paquet = models.CharField(max_length=50, choices=paquets.CHOIX_PAQUETS, default=paquets.PAQUET_PAR_DEFAUT)  # Jeu de cartes utilisé
+    version = models.PositiveIntegerField(default=0)  # Incrémentée à chaque vote ou validation
+    date_modification = models.DateTimeField(default=timezone.now)
+
+    def incrementer_version(self, rafraichir=False):
+        """
+        Incrémente le compteur de version de la partie (ETag, caches de fragments).
+        L'instance n'est relue que si `rafraichir` est vrai (requête supplémentaire).
+        """
+        maintenant = timezone.now()
+        Partie.objects.filter(pk=self.pk).update(version=F('version') + 1, date_modification=maintenant)
+        if rafraichir:
+            self.refresh_from_db(fields=['version', 'date_modification'])
+
+    def obtenir_paquet(self):
+        """Retourne le paquet de cartes (immuable, chargé au démarrage) de la partie."""
+        return paquets.obtenir_paquet(self.paquet)
+
+    def cle_cache(self, fragment):
+        """Clé de cache d'un fragment, invalidée à chaque changement de version."""
+        return f"partie:{self.pk}:v{self.version}:{fragment}"
+
+    def cle_cache_participants(self):
+        """Clé de cache des participants : ne dépend pas de la version, à supprimer si les participants changent."""
+        return f"partie:{self.pk}:participants"
 
     # def importer_fonctionnalites(self, fichier_json):
     #     """
@@ -80,7 +115,9 @@ class Partie(models.Model):
 
     def calculer_moyenne_votes(self, votes):
         """Calcule la moyenne des votes."""
-        valeurs_valides = [vote.vote for vote in votes if isinstance(vote.vote, int)]
+        paquet = self.obtenir_paquet()
+        cartes = [paquet.carte(vote.vote) for vote in votes]
+        valeurs_valides = [carte.valeur for carte in cartes if carte is not None and carte.valeur is not None]
         return round(sum(valeurs_valides) / len(valeurs_valides), 2) if valeurs_valides else 0
 
 
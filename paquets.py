@@ -0,0 +1,119 @@
+from numbers import Real
+from types import MappingProxyType
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+# Paquets disponibles : nom -> (libellé, cartes). Une carte est une valeur ou un couple (code, valeur).
+# Des paquets supplémentaires peuvent être déclarés dans settings.PLANNING_POKER_PAQUETS.
+PAQUETS_PAR_DEFAUT = {
+    'fibonacci': ('Fibonacci', [0, 1, 2, 3, 5, 8, 13, 20, 40, 100]),
+    'tshirt': ('Tailles de T-shirt', [('XS', 1), ('S', 2), ('M', 3), ('L', 5), ('XL', 8), ('XXL', 13)]),
+    'puissances_de_deux': ('Puissances de deux', [0, 1, 2, 4, 8, 16, 32, 64]),
+}
+
+PAQUET_PAR_DEFAUT = 'fibonacci'
+
+# Codes des cartes spéciales ajoutées à chaque paquet
+CODES_SPECIAUX = ('cafe', 'interro')
+
+
+class Carte:
+    """Carte de vote immuable : `code` est la valeur postée et stockée dans Vote.vote."""
+    __slots__ = ('code', 'valeur', 'cafe', 'interro')
+
+    def __init__(self, code, valeur=None, cafe=False, interro=False):
+        object.__setattr__(self, 'code', code)
+        object.__setattr__(self, 'valeur', valeur)
+        object.__setattr__(self, 'cafe', cafe)
+        object.__setattr__(self, 'interro', interro)
+
+    def __setattr__(self, nom, valeur):
+        raise AttributeError("Une carte de vote est immuable.")
+
+    def __delattr__(self, nom):
+        raise AttributeError("Une carte de vote est immuable.")
+
+    def __str__(self):
+        return self.code
+
+    def __repr__(self):
+        return f"Carte({self.code!r})"
+
+
+class Paquet:
+    """Paquet de cartes immuable avec recherche d'une carte par son code en O(1)."""
+    __slots__ = ('nom', 'libelle', 'cartes', '_par_code')
+
+    def __init__(self, nom, libelle, cartes):
+        cartes = tuple(cartes)
+        object.__setattr__(self, 'nom', nom)
+        object.__setattr__(self, 'libelle', libelle)
+        object.__setattr__(self, 'cartes', cartes)
+        object.__setattr__(self, '_par_code', MappingProxyType({carte.code: carte for carte in cartes}))
+
+    def __setattr__(self, nom, valeur):
+        raise AttributeError("Un paquet de cartes est immuable.")
+
+    def __delattr__(self, nom):
+        raise AttributeError("Un paquet de cartes est immuable.")
+
+    def carte(self, code):
+        """Retourne la carte correspondant au code, ou None si elle n'est pas dans le paquet."""
+        return self._par_code.get(code)
+
+    def __iter__(self):
+        return iter(self.cartes)
+
+    def __len__(self):
+        return len(self.cartes)
+
+    def __str__(self):
+        return self.libelle
+
+
+def _construire_paquet(nom, libelle, definitions):
+    cartes = []
+    for definition in definitions:
+        if isinstance(definition, (tuple, list)):
+            if len(definition) != 2:
+                raise ImproperlyConfigured(f"Paquet '{nom}' : la carte {definition!r} doit être un couple (code, valeur).")
+            code, valeur = definition
+        else:
+            code, valeur = str(definition), definition
+        if not isinstance(code, str):
+            raise ImproperlyConfigured(f"Paquet '{nom}' : le code de la carte {code!r} doit être une chaîne.")
+        if isinstance(valeur, bool) or not isinstance(valeur, Real):
+            raise ImproperlyConfigured(f"Paquet '{nom}' : la carte {code!r} doit avoir une valeur numérique.")
+        if code in CODES_SPECIAUX:
+            raise ImproperlyConfigured(f"Paquet '{nom}' : le code {code!r} est réservé aux cartes spéciales.")
+        if any(carte.code == code for carte in cartes):
+            raise ImproperlyConfigured(f"Paquet '{nom}' : la carte {code!r} est définie plusieurs fois.")
+        cartes.append(Carte(code, valeur))
+    # Cartes spéciales communes à tous les paquets
+    cartes.append(Carte('cafe', cafe=True))
+    cartes.append(Carte('interro', interro=True))
+    return Paquet(nom, libelle, cartes)
+
+
+def _charger_paquets():
+    definitions = dict(PAQUETS_PAR_DEFAUT)
+    definitions.update(getattr(settings, 'PLANNING_POKER_PAQUETS', {}))
+    return MappingProxyType(
+        {nom: _construire_paquet(nom, libelle, cartes) for nom, (libelle, cartes) in definitions.items()}
+    )
+
+
+# Chargés une seule fois, au démarrage
+PAQUETS = _charger_paquets()
+CHOIX_PAQUETS = [(nom, paquet.libelle) for nom, paquet in PAQUETS.items()]
+# Codes présents dans au moins un paquet : permet de refuser une carte avant toute requête
+CODES_CARTES = frozenset(carte.code for paquet in PAQUETS.values() for carte in paquet)
+
+
+def obtenir_paquet(nom):
+    """Retourne le paquet demandé ; un nom inconnu (paquet retiré des settings) est une erreur de configuration."""
+    try:
+        return PAQUETS[nom]
+    except KeyError:
+        raise ImproperlyConfigured(f"Paquet de cartes inconnu : {nom!r}.") from None
@@ -0,0 +1,174 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Modes de jeu simulés (mêmes codes que consensus.MODES)
+MODES = ['strict', 'moyenne', 'mediane', 'majorite_absolue', 'majorite_relative']
+
+# Valeurs du paquet Fibonacci par défaut ("cafe" et "interro" ne sont pas simulées)
+CARTES = (0, 1, 2, 3, 5, 8, 13, 20, 40, 100)
+
+
+def carte_la_plus_proche(estimations, cartes):
+    """Remplace chaque estimation par la carte la plus proche (cartes triées)."""
+    indices = np.clip(np.searchsorted(cartes, estimations), 1, len(cartes) - 1)
+    gauche = cartes[indices - 1]
+    droite = cartes[indices]
+    return np.where(estimations - gauche <= droite - estimations, gauche, droite)
+
+
+def regle_consensus(mode, votes, premier_tour, cartes):
+    """
+    Applique la règle de consensus d'un mode à un lot de tours de vote.
+
+    Version vectorisée de consensus.decision_tour, la règle de demarrer_vote :
+    un tour unanime conclut ; sinon le premier tour de chaque fonctionnalité
+    et tous les tours du mode strict échouent, et les autres modes tranchent
+    aux tours suivants par moyenne, médiane ou majorité. `votes` est un
+    tableau (tours, joueurs) ; retourne le masque des tours conclus et
+    l'estimation retenue pour chacun (sans signification hors du masque).
+    """
+    unanimes = np.all(votes == votes[:, :1], axis=1)
+    if mode == 'strict' or premier_tour:
+        return unanimes, votes[:, 0]
+    if mode == 'moyenne':
+        return np.ones(len(votes), dtype=bool), votes.mean(axis=1)
+    if mode == 'mediane':
+        return np.ones(len(votes), dtype=bool), np.median(votes, axis=1)
+
+    # Modes à majorité : nombre de votes par carte pour chaque tour
+    comptes = (votes[:, :, None] == cartes[None, None, :]).sum(axis=1)
+    maximum = comptes.max(axis=1)
+    gagnante = cartes[comptes.argmax(axis=1)]
+    if mode == 'majorite_absolue':
+        return maximum * 2 > votes.shape[1], gagnante
+    if mode == 'majorite_relative':
+        # Une égalité entre cartes en tête impose un nouveau tour
+        return (comptes == maximum[:, None]).sum(axis=1) == 1, gagnante
+    raise ValueError(f"Mode de jeu inconnu : {mode}")
+
+
+def simuler_lot(mode, simulations, joueurs, cartes, max_tours, biais, bruit, convergence, graine):
+    """
+    Simule `simulations` fonctionnalités votées par une population synthétique.
+
+    Chaque fonctionnalité a une complexité réelle (log-normale), chaque joueur
+    un biais personnel et un bruit à chaque tour. Après un tour sans consensus,
+    la discussion rapproche chaque joueur de la moyenne du groupe.
+    Le bruit est tiré pour toutes les fonctionnalités à chaque tour afin qu'une
+    même graine produise les mêmes tirages quel que soit le mode.
+    Retourne des sommes partielles, agrégées ensuite par simuler().
+    """
+    rng = np.random.default_rng(graine)
+    cartes = np.sort(np.asarray(cartes, dtype=float))
+
+    complexite = rng.lognormal(np.log(5), 0.8, size=simulations)
+    perception = complexite[:, None] * rng.lognormal(0, biais, size=(simulations, joueurs))
+
+    tours = np.full(simulations, max_tours)  # Une fonctionnalité abandonnée coûte max_tours tours
+    estimation = np.full(simulations, np.nan)
+    actifs = np.arange(simulations)
+
+    for tour in range(1, max_tours + 1):
+        if actifs.size == 0:
+            break
+        bruit_tour = rng.lognormal(0, bruit, size=(simulations, joueurs))
+        estimations = perception[actifs] * bruit_tour[actifs]
+        votes = carte_la_plus_proche(estimations, cartes)
+        conclus, valeurs = regle_consensus(mode, votes, tour == 1, cartes)
+
+        tours[actifs[conclus]] = tour
+        estimation[actifs[conclus]] = valeurs[conclus]
+
+        # Discussion : les joueurs se rapprochent de la moyenne des votes du tour
+        restants = actifs[~conclus]
+        moyenne_groupe = votes[~conclus].mean(axis=1, keepdims=True)
+        perception[restants] = (1 - convergence) * perception[restants] + convergence * moyenne_groupe
+        actifs = restants
+
+    convergees = ~np.isnan(estimation)
+    erreurs = np.abs(estimation[convergees] - complexite[convergees]) / complexite[convergees]
+    tours = tours.astype(float)
+    return {
+        'simulations': simulations,
+        'somme_tours': float(tours.sum()),
+        'somme_tours_carres': float((tours ** 2).sum()),
+        'somme_tours_consensus': float(tours[convergees].sum()),
+        'convergees': int(convergees.sum()),
+        'somme_erreurs': float(erreurs.sum()),
+    }
+
+
+def simuler(modes=None, simulations=100_000, joueurs=5, cartes=CARTES, max_tours=20,
+            duree_tour=120.0, biais=0.3, bruit=0.2, convergence=0.5,
+            processus=None, graine=None, taille_lot=50_000):
+    """
+    Compare les modes de jeu par simulation de Monte Carlo.
+
+    Les simulations sont découpées en lots répartis sur un pool de processus
+    (`processus=1` exécute tout dans le processus courant). Chaque lot utilise
+    la même graine pour tous les modes : les modes sont comparés sur les mêmes
+    fonctionnalités et les mêmes joueurs. Le mode strict pouvant ne jamais
+    conclure, chaque fonctionnalité est arrêtée après `max_tours` tours et
+    comptée comme non convergée.
+
+    Retourne, pour chaque mode : le nombre moyen de tours et son écart-type,
+    le temps moyen par fonctionnalité (en secondes), le taux de
+    non-convergence, l'erreur relative moyenne de l'estimation retenue et le
+    nombre moyen de tours des seules fonctionnalités ayant abouti.
+    Les tours et le temps comptent chaque fonctionnalité abandonnée pour
+    `max_tours` tours ; l'erreur et `tours_moyens_consensus` sont censurés
+    (fonctionnalités ayant abouti seulement, None si aucune n'a abouti).
+    """
+    modes = list(modes or MODES)
+    for mode in modes:
+        if mode not in MODES:
+            raise ValueError(f"Mode de jeu inconnu : {mode}")
+    if simulations < 1 or taille_lot < 1 or joueurs < 1 or max_tours < 1:
+        raise ValueError("Les simulations, la taille des lots, les joueurs et les tours maximum doivent être positifs.")
+    if not cartes:
+        raise ValueError("Le paquet de cartes simulé est vide.")
+    if processus is not None and processus < 1:
+        raise ValueError("Le nombre de processus doit être positif.")
+
+    tailles = [taille_lot] * (simulations // taille_lot)
+    if simulations % taille_lot:
+        tailles.append(simulations % taille_lot)
+    # Nombres aléatoires communs : le lot j a la même graine dans tous les modes
+    graines = np.random.SeedSequence(graine).spawn(len(tailles))
+
+    taches = []
+    for mode in modes:
+        for taille, graine_lot in zip(tailles, graines):
+            taches.append((mode, taille, joueurs, tuple(cartes), max_tours,
+                           biais, bruit, convergence, graine_lot))
+
+    if processus == 1:
+        resultats_lots = [simuler_lot(*tache) for tache in taches]
+    else:
+        with ProcessPoolExecutor(max_workers=processus or os.cpu_count()) as pool:
+            resultats_lots = list(pool.map(simuler_lot, *zip(*taches)))
+
+    resultats = {}
+    for (mode, *_), lot in zip(taches, resultats_lots):
+        total = resultats.setdefault(mode, dict.fromkeys(lot, 0))
+        for cle, valeur in lot.items():
+            total[cle] += valeur
+
+    rapport = {}
+    for mode in modes:
+        total = resultats[mode]
+        n = total['simulations']
+        convergees = total['convergees']
+        tours_moyens = total['somme_tours'] / n
+        variance = max(total['somme_tours_carres'] / n - tours_moyens ** 2, 0.0)
+        rapport[mode] = {
+            'tours_moyens': round(tours_moyens, 3),
+            'ecart_type_tours': round(variance ** 0.5, 3),
+            'temps_par_fonctionnalite': round(tours_moyens * duree_tour, 1),
+            'taux_non_convergence': round(1 - convergees / n, 4),
+            'erreur_moyenne': round(total['somme_erreurs'] / convergees, 4) if convergees else None,
+            'tours_moyens_consensus': round(total['somme_tours_consensus'] / convergees, 3) if convergees else None,
+        }
+    return rapport
@@ -0,0 +1,72 @@
+import unittest
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+import paquets
+
+
+class PaquetTests(unittest.TestCase):
+    def test_recherche_par_code(self):
+        fibonacci = paquets.PAQUETS['fibonacci']
+        self.assertIs(fibonacci.carte('5'), fibonacci.carte('5'))
+        self.assertEqual(fibonacci.carte('5').valeur, 5)
+        self.assertIsNone(fibonacci.carte('05'))
+        self.assertIsNone(fibonacci.carte(None))
+        self.assertIsNone(fibonacci.carte('XL'))
+        self.assertEqual(paquets.PAQUETS['tshirt'].carte('XL').valeur, 8)
+
+    def test_cartes_speciales_dans_chaque_paquet(self):
+        for paquet in paquets.PAQUETS.values():
+            self.assertTrue(paquet.carte('cafe').cafe)
+            self.assertTrue(paquet.carte('interro').interro)
+            self.assertIsNone(paquet.carte('cafe').valeur)
+
+    def test_codes_connus(self):
+        self.assertIn('XXL', paquets.CODES_CARTES)
+        self.assertIn('64', paquets.CODES_CARTES)
+        self.assertNotIn('05', paquets.CODES_CARTES)
+
+    def test_cartes_et_paquets_immuables(self):
+        fibonacci = paquets.PAQUETS['fibonacci']
+        with self.assertRaises(AttributeError):
+            fibonacci.carte('5').valeur = 8
+        with self.assertRaises(AttributeError):
+            fibonacci.nom = 'autre'
+        with self.assertRaises(TypeError):
+            fibonacci._par_code['5'] = None
+        with self.assertRaises(TypeError):
+            paquets.PAQUETS['autre'] = fibonacci
+
+    def test_paquet_inconnu(self):
+        self.assertIs(paquets.obtenir_paquet('tshirt'), paquets.PAQUETS['tshirt'])
+        with self.assertRaises(ImproperlyConfigured):
+            paquets.obtenir_paquet('supprime')
+
+
+class ChargementPaquetsTests(unittest.TestCase):
+    def test_paquet_des_settings(self):
+        with override_settings(PLANNING_POKER_PAQUETS={'perso': ('Perso', [('petit', 1), 2.5])}):
+            perso = paquets._charger_paquets()['perso']
+        self.assertEqual([carte.code for carte in perso], ['petit', '2.5', 'cafe', 'interro'])
+
+    def test_definitions_invalides(self):
+        invalides = [
+            ['?'],              # valeur non numérique
+            [('a', True)],      # booléen
+            [('cafe', 1)],      # code réservé
+            [('interro', 1)],
+            [1, ('1', 2)],      # code en double
+            [(1, 2)],           # code non textuel
+            [('a',)],           # mauvaise arité
+            [('a', 1, 2)],
+        ]
+        for cartes in invalides:
+            with override_settings(PLANNING_POKER_PAQUETS={'perso': ('Perso', cartes)}):
+                with self.assertRaises(ImproperlyConfigured, msg=cartes):
+                    paquets._charger_paquets()
@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+
+import consensus
+import simulation
+
+CARTES = np.array(simulation.CARTES, dtype=float)
+
+
+class RegleConsensusTests(unittest.TestCase):
+    def setUp(self):
+        self.votes = np.array([
+            [5, 5, 5, 5],    # unanime
+            [3, 5, 5, 8],    # majorité relative seulement
+            [5, 5, 5, 8],    # majorité absolue
+            [3, 3, 5, 5],    # égalité en tête
+        ], dtype=float)
+
+    def test_premier_tour_exige_unanimite(self):
+        for mode in simulation.MODES:
+            conclus, valeurs = simulation.regle_consensus(mode, self.votes, True, CARTES)
+            self.assertEqual(conclus.tolist(), [True, False, False, False], mode)
+            self.assertEqual(valeurs[0], 5)
+
+    def test_strict_exige_unanimite_a_chaque_tour(self):
+        conclus, _ = simulation.regle_consensus('strict', self.votes, False, CARTES)
+        self.assertEqual(conclus.tolist(), [True, False, False, False])
+
+    def test_moyenne_et_mediane_concluent_apres_le_premier_tour(self):
+        conclus, valeurs = simulation.regle_consensus('moyenne', self.votes, False, CARTES)
+        self.assertTrue(conclus.all())
+        self.assertEqual(valeurs.tolist(), [5, 5.25, 5.75, 4])
+        conclus, valeurs = simulation.regle_consensus('mediane', self.votes, False, CARTES)
+        self.assertTrue(conclus.all())
+        self.assertEqual(valeurs.tolist(), [5, 5, 5, 4])
+
+    def test_majorites(self):
+        conclus, valeurs = simulation.regle_consensus('majorite_absolue', self.votes, False, CARTES)
+        self.assertEqual(conclus.tolist(), [True, False, True, False])
+        self.assertEqual(valeurs[2], 5)
+        conclus, valeurs = simulation.regle_consensus('majorite_relative', self.votes, False, CARTES)
+        self.assertEqual(conclus.tolist(), [True, True, True, False])
+        self.assertEqual(valeurs[1], 5)
+
+    def test_version_vectorisee_identique_a_decision_tour(self):
+        self.assertEqual(simulation.MODES, consensus.MODES)
+        rng = np.random.default_rng(0)
+        votes = rng.choice(CARTES[:5], size=(500, 4))
+        for mode in simulation.MODES:
+            for premier_tour in (True, False):
+                conclus, valeurs = simulation.regle_consensus(mode, votes, premier_tour, CARTES)
+                for ligne, conclu, valeur in zip(votes, conclus, valeurs):
+                    attendu, estimation = consensus.decision_tour(mode, ligne.tolist(), premier_tour)
+                    self.assertEqual(conclu, attendu, (mode, premier_tour, ligne))
+                    if attendu:
+                        self.assertAlmostEqual(valeur, estimation)
+
+
+class DecisionTourTests(unittest.TestCase):
+    def test_carte_sans_valeur_jamais_unanime(self):
+        self.assertEqual(consensus.decision_tour('strict', [None, None], False), (False, None))
+        self.assertEqual(consensus.decision_tour('moyenne', [None, 3, 5], False), (True, 4))
+
+    def test_mode_inconnu(self):
+        with self.assertRaises(ValueError):
+            consensus.decision_tour('inconnu', [1], True)
+
+
+class SimulerTests(unittest.TestCase):
+    def test_meme_graine_meme_rapport_quel_que_soit_le_nombre_de_processus(self):
+        parametres = dict(simulations=3000, taille_lot=1000, graine=7, max_tours=5)
+        self.assertEqual(simulation.simuler(processus=1, **parametres), simulation.simuler(processus=2, **parametres))
+
+    def test_fonctionnalites_abandonnees_comptees_pour_max_tours(self):
+        rapport = simulation.simuler(modes=['strict', 'moyenne'], simulations=1000, processus=1, graine=1, max_tours=2)
+        self.assertGreater(rapport['strict']['taux_non_convergence'], 0)
+        self.assertGreaterEqual(rapport['strict']['temps_par_fonctionnalite'],
+                                rapport['moyenne']['temps_par_fonctionnalite'])
+        self.assertLess(rapport['strict']['tours_moyens_consensus'], rapport['strict']['tours_moyens'])
+
+    def test_parametres_invalides(self):
+        for parametres in [dict(simulations=0), dict(taille_lot=0), dict(joueurs=0), dict(cartes=()),
+                           dict(processus=0), dict(modes=['inconnu'])]:
+            with self.assertRaises(ValueError, msg=parametres):
+                simulation.simuler(**parametres)
@@ -1,12 +1,17 @@
 from django.shortcuts import render, redirect ,get_object_or_404
 from django.http import JsonResponse
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.views.decorators.http import condition
 
 from django.contrib.staticfiles import finders
 from django.utils import timezone
 import time
 from .models import Partie, Fonctionnalite, Vote, ValidationFonctionnalite, Participant
 from .forms import PartieForm, VoteForm , ParticipantForm
+from .paquets import CODES_CARTES
+from .consensus import decision_tour
 import json
 import os
 from django.contrib import messages
@@ -60,6 +65,7 @@ def creer_partie(request):
             partie.save()
             partie.participants.set(participants)
             form.save_m2m()
+            cache.delete(partie.cle_cache_participants())
 
             # Importer ou mettre à jour les fonctionnalités
             with open(fichier_json, 'r') as file:
@@ -86,6 +92,11 @@ def creer_partie(request):
             toutes_fonctionnalites = Fonctionnalite.objects.all()
             partie.fonctionnalites.set(toutes_fonctionnalites)
 
+            # Les fonctionnalités remises à non valide sont partagées : invalider les autres parties
+            Partie.objects.filter(fonctionnalites__in=toutes_fonctionnalites).distinct().update(
+                version=F('version') + 1, date_modification=timezone.now()
+            )
+
             # Message de succès et redirection
             messages.success(request, "La partie a été créée avec succès.")
             return redirect('lister_parties')
@@ -98,7 +109,47 @@ def creer_partie(request):
     return render(request, 'parties/cree_partie.html', {'form': form})
 
 
+# Version et date de modification d'une partie, lues une seule fois par requête
+def _etat_partie(request, partie_id):
+    if request.method not in ('GET', 'HEAD'):
+        return None  # Requêtes conditionnelles uniquement en lecture : pas de requête SQL sur un POST
+    if not hasattr(request, '_etat_partie'):
+        request._etat_partie = Partie.objects.filter(id=partie_id).values_list('version', 'date_modification').first()
+    return request._etat_partie
+
+
+def _etag_detail_partie(request, id):
+    etat = _etat_partie(request, id)
+    if etat is None or len(messages.get_messages(request)):
+        return None  # Partie introuvable ou messages en attente : pas de réponse 304
+    return f'"partie-{id}-v{etat[0]}"'
+
+
+def _last_modified_detail_partie(request, id):
+    etat = _etat_partie(request, id)
+    if etat is None or len(messages.get_messages(request)):
+        return None
+    return etat[1]
+
+
+def _etag_vote(request, partie_id):
+    etat = _etat_partie(request, partie_id)
+    if etat is None or len(messages.get_messages(request)):
+        return None
+    # Le joueur courant est stocké en session : il fait partie de l'état affiché
+    participant_index = request.session.get('participant_index', 0)
+    return f'"vote-{partie_id}-v{etat[0]}-j{participant_index}"'
+
+
+def _last_modified_vote(request, partie_id):
+    etat = _etat_partie(request, partie_id)
+    if etat is None or len(messages.get_messages(request)):
+        return None
+    return etat[1]
+
+
 # Vue pour afficher les détails d'une partie    
+@condition(etag_func=_etag_detail_partie, last_modified_func=_last_modified_detail_partie)
 def detail_partie(request, id):
     # Récupère la partie spécifique
     partie = get_object_or_404(Partie, id=id)
@@ -145,7 +196,8 @@ def reprendre_partie(request, partie_id):
 
             
 
-            partie.save()   
+            partie.save(update_fields=['statut'])  # Ne pas réécrire une version périmée
+            partie.incrementer_version()
 
         messages.success(request, "La partie a été reprise avec succès.")
     else:
@@ -185,7 +237,8 @@ def lancer_partie(request, partie_id):
     
     if partie.statut == "new":
         partie.statut = "en_attente"
-        partie.save()
+        partie.save(update_fields=['statut'])
+        partie.incrementer_version()
         # Rediriger vers le vote
         return redirect('demarrer_vote', partie_id=partie.id)
     return redirect('lister_parties')
@@ -281,94 +334,97 @@ def lancer_partie(request, partie_id):
 #         'moyenne_vote': request.session.pop('moyenne_vote', None), 
 #     }
 #     return render(request, 'parties/vote.html', context)
+@condition(etag_func=_etag_vote, last_modified_func=_last_modified_vote)
 def demarrer_vote(request, partie_id):
+    # Refuser une carte inconnue de tous les paquets avant toute requête
+    if request.method == "POST" and request.POST.get('vote') not in CODES_CARTES:
+        messages.error(request, "Carte de vote invalide.")
+        return redirect('demarrer_vote', partie_id=partie_id)
+
     # Récupérer la partie et la fonctionnalité en cours
     partie = get_object_or_404(Partie, id=partie_id)
+    paquet = partie.obtenir_paquet()
+    carte = paquet.carte(request.POST.get('vote')) if request.method == "POST" else None
+    if request.method == "POST" and carte is None:
+        messages.error(request, f"Cette carte ne fait pas partie du paquet {paquet}.")
+        return redirect('demarrer_vote', partie_id=partie.id)
+
+    # Relue à chaque requête : l'état valide est partagé entre les parties
     fonctionnalite_en_cours = partie.fonctionnalites.filter(valide=False).first()
 
     if not fonctionnalite_en_cours:
         # Toutes les fonctionnalités ont été votées
         partie.statut = "fin"
         fichier_backlog = partie.sauvegarder_backlog()
-        partie.save()
+        partie.save(update_fields=['statut'])
+        partie.incrementer_version()
         messages.success(request, "La partie est terminée et le backlog a été mis à jour !")
         return redirect('lister_parties')
 
-    participants = partie.participants.all()
+    # Les participants ne changent pas en cours de partie : cache indépendant de la version
+    participants = cache.get_or_set(partie.cle_cache_participants(), lambda: list(partie.participants.all()))
     participant_index = request.session.get('participant_index', 0)
-    participant_en_cours = participants[participant_index % participants.count()]
+    participant_en_cours = participants[participant_index % len(participants)]
 
     if request.method == "POST":
         # Enregistrer le vote
-        carte_vote = request.POST.get('vote')
-        if carte_vote != "interro":  # Ignorer la carte "interro"
+        if not carte.interro:  # Ignorer la carte "interro"
             Vote.objects.create(
                 participant=participant_en_cours,
                 fonctionnalite=fonctionnalite_en_cours,
                 partie=partie,
-                vote=int(carte_vote) if carte_vote.isdigit() else carte_vote,
+                vote=carte.code,
                 mode_jeu=partie.mode_jeu
             )
+            partie.incrementer_version()
 
         # Passer au prochain participant
-        participant_index = (participant_index + 1) % participants.count()
+        participant_index = (participant_index + 1) % len(participants)
         request.session['participant_index'] = participant_index
 
         # Si tous les participants ont voté
         if participant_index == 0:
             # Récupérer tous les votes pour la fonctionnalité en cours
             votes = Vote.objects.filter(fonctionnalite=fonctionnalite_en_cours, partie=partie)
-            votes_valides = [v.vote for v in votes if isinstance(v.vote, int)]  # Exclure "interro"
-            votes_normalises = [int(v.vote) for v in votes if isinstance(v.vote, (int, str)) and str(v.vote).isdigit()]
-            votes_unanimes = votes.values_list('vote', flat=True).distinct()
+            cartes_votees = [paquet.carte(v.vote) for v in votes]
+            votes_unanimes = set(cartes_votees)  # Les cartes sont uniques par paquet : comparaison par identité
             # Gérer la carte "café"
-            if len(votes) == participants.count() and all(v.vote == "cafe" for v in votes):
+            if len(cartes_votees) == len(participants) and all(c is not None and c.cafe for c in cartes_votees):
                 fichier_etat = partie.sauvegarder_etat_partie()
                 messages.warning(request, f"La partie a été mise en pause. État sauvegardé dans {fichier_etat}.")
                 return redirect('lister_parties')
 
-            # Mode Strict : Tous les votes doivent être identiques
-            if partie.mode_jeu == "strict":
-                if len(votes_unanimes) == 1:
-                    fonctionnalite_en_cours.valide = True
-                    fonctionnalite_en_cours.save()
-                else:
-                    votes.delete()
-                    messages.warning(request, "Les votes ne sont pas unanimes. Recommencez pour cette fonctionnalité.")
-
-            # Mode Moyenne : Gestion des tours
-            elif partie.mode_jeu == "moyenne":
-                if not request.session.get('premier_tour_fini', False):
-                    # Premier tour : Unanimité obligatoire
-                    if len(votes_unanimes) == 1:
-                        fonctionnalite_en_cours.valide = True
-                        fonctionnalite_en_cours.save()
-                        request.session['premier_tour_fini'] = True
-                    else:
-                        votes.delete()
-                        messages.warning(request, "Les votes ne sont pas unanimes. Recommencez pour cette fonctionnalité.")
-                        # Premier tour unanime
-      
-                else:
-                    # Deuxième tour et suivants : Calcul de la moyenne
-                    if len(votes_unanimes) == 1:
-                        fonctionnalite_en_cours.valide = True
-                        fonctionnalite_en_cours.save()
-                    else:
-                        moyenne = partie.calculer_moyenne_votes(votes)
-                        messages.info(request, f"Temps de discussion : Moyenne des votes = {moyenne}")
-                        time.sleep(10)  # Pause de 10 secondes
-                        fonctionnalite_en_cours.valide = True
-                        fonctionnalite_en_cours.save()
+            # Règle de consensus du mode (consensus.decision_tour, partagée avec le simulateur) :
+            # le premier tour d'une fonctionnalité exige l'unanimité
+            premier_tour = request.session.get('premier_tour_fini') != fonctionnalite_en_cours.id
+            conclu, estimation = decision_tour(
+                partie.mode_jeu, [c.valeur if c is not None else None for c in cartes_votees], premier_tour
+            )
+            if conclu:
+                if len(votes_unanimes) > 1:
+                    messages.info(request, f"Temps de discussion : estimation retenue = {round(estimation, 2)}")
+                    time.sleep(10)  # Pause de 10 secondes
+                fonctionnalite_en_cours.valider()
+            else:
+                request.session['premier_tour_fini'] = fonctionnalite_en_cours.id
+                votes.delete()
+                messages.warning(request, "Les votes ne sont pas unanimes. Recommencez pour cette fonctionnalité.")
+            if not fonctionnalite_en_cours.valide:
+                partie.incrementer_version()  # valider() a déjà incrémenté toutes les parties liées
             request.session['participant_index'] = 0
         return redirect('demarrer_vote', partie_id=partie.id)
 
-    cartes = [0, 1, 2, 3, 5, 8, 13, 20, 40, 100, "cafe", "interro"]
     context = {
         'partie': partie,
         'fonctionnalite_en_cours': fonctionnalite_en_cours,
         'participant_en_cours': participant_en_cours,
-        'cartes': cartes,
+        'cartes': paquet.cartes,  # Paquet immuable chargé au démarrage
+        # Clés pour {% cache %} dans le template, ex. {% cache 600 vote_description cles_fragments.description %}
+        'cles_fragments': {
+            'description': partie.cle_cache('description'),
+            'cartes': partie.cle_cache('cartes'),
+            'participants': partie.cle_cache_participants(),
+        },
         # 'discussion_activee': request.session.pop('discussion_activee', False),
         # 'moyenne_vote': request.session.pop('moyenne_vote', None),  # Récupérer la moyenne pour affichage
     }